@@ -32,27 +32,35 @@ check_research_prompt = markdown_to_prompt_template("agent/architect/prompts/che
 conduct_research_prompt = markdown_to_prompt_template("agent/architect/prompts/conduct_research_plan_prompt.md")
 extract_implementation_prompt = markdown_to_prompt_template("agent/architect/prompts/extract_implementation_plan.md")
 
+# output parser, built once and shared between the runnable and the format instructions
+implementation_plan_parser = JsonOutputParser(pydantic_object=ImplementationPlan)
+
 # runnable
 plan_next_step_runnable = plan_next_step_prompt | ChatAnthropic(model="claude-sonnet-4-20250514").with_structured_output(ResearchStep)
 check_research_runnable = check_research_prompt | ChatAnthropic(model="claude-sonnet-4-20250514").with_structured_output(ResearchEvaluation)
 conduct_research_runnable = conduct_research_prompt | ChatAnthropic(model="claude-sonnet-4-20250514").bind_tools(search_tools+codemap_tools)
-extract_implementation_runnable = extract_implementation_prompt | ChatAnthropic(model="claude-sonnet-4-20250514") | JsonOutputParser(pydantic_object=ImplementationPlan)
+extract_implementation_runnable = extract_implementation_prompt | ChatAnthropic(model="claude-sonnet-4-20250514") | implementation_plan_parser
 
 tool_node = ToolNode(codemap_tools+search_tools, messages_key="implementation_research_scratchpad")
 
 class ComeUpWithResearchNextStepOutput(TypedDict):
     research_next_step: str
+    codebase_structure: str
     implementation_research_scratchpad: List[AnyMessage]
 
 def come_up_with_research_next_step(state: SoftwareArchitectState) -> ComeUpWithResearchNextStepOutput:
     """Generate the next research step based on the current state"""
+    # Ingest the codebase structure once per run and keep it in the state,
+    # the repo does not change while the architect is researching it
+    codebase_structure = state.codebase_structure or get_files_structure.invoke({
+        "directory": "./workspace_repo"
+    })
     response = plan_next_step_runnable.invoke({
         "implementation_research_scratchpad": state.implementation_research_scratchpad,
-        "codebase_structure": get_files_structure.invoke({
-            "directory": "./workspace_repo"
-        }),
+        "codebase_structure": codebase_structure,
     })
     return {"research_next_step": response.hypothesis,
+            "codebase_structure": codebase_structure,
             "implementation_research_scratchpad": [
                 AIMessage(content=f"My next thing i need to check is {response.hypothesis}"
                           f"This is why I think it is useful: {response.reasoning}")]}
@@ -81,7 +89,7 @@ def conduct_research(state: SoftwareArchitectState):
     """Conduct research based on the proposed hypothesis"""
     response = conduct_research_runnable.invoke({
         "implementation_research_scratchpad": state.implementation_research_scratchpad,
-        "codebase_structure": get_files_structure.invoke({"directory": "./workspace_repo"})
+        "codebase_structure": state.codebase_structure
     })
     return {"implementation_research_scratchpad": [response]}
 
@@ -105,8 +113,8 @@ def extract_implementation_plan(state: SoftwareArchitectState):
     """Extract implementation plan from research findings"""
     response = extract_implementation_runnable.invoke({
         "research_findings": convert_tools_messages_to_ai_and_human(state.implementation_research_scratchpad),
-        "codebase_structure": get_files_structure.invoke({"directory": "./workspace_repo"}),
-        "output_format": JsonOutputParser(pydantic_object=ImplementationPlan).get_format_instructions()
+        "codebase_structure": state.codebase_structure,
+        "output_format": implementation_plan_parser.get_format_instructions()
     })
     response = ImplementationPlan(**response)
     return {"implementation_plan": response}
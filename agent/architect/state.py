@@ -10,3 +10,4 @@ class SoftwareArchitectState(BaseModel):
     implementation_plan: Optional[ImplementationPlan] = Field(None, description="The implementation plan to be executed")
     implementation_research_scratchpad: Annotated[list[AnyMessage], add_messages] = Field([], description="The scratchpad for implementation research")
     is_valid_research_step: Optional[bool] = Field(None, description="Whether the research step is valid")
+    codebase_structure: Optional[str] = Field(None, description="The codebase structure")
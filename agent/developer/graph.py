@@ -29,6 +29,10 @@ get_clear_implementation_plan_prompt = markdown_to_prompt_template("agent/develo
 
 # Create the runnable with the prompt and model
 get_clear_implementation_plan_runnable = get_clear_implementation_plan_prompt | ChatAnthropic(model="claude-sonnet-4-20250514").bind_tools(search_tools+codemap_tools)
+
+# Output parser for the diff tasks, built once instead of per atomic task
+diffs_parser = JsonOutputParser(pydantic_object=Diffs)
+
 dmp = diff_match_patch()
 def start_implementing(state: SoftwareDeveloperState):
     return {
@@ -146,10 +150,9 @@ def creating_diffs_for_task(state: SoftwareDeveloperState):
         with open(file_path, "r") as file:
             file_content = file.read()
         # add line numbers
-        lines = []
-        for i, line in enumerate(file_content.splitlines(), start=1):
-            lines.append(f"{i}| {line}")
-        file_content = "\n".join(lines)
+        file_content = "\n".join(
+            f"{i}| {line}" for i, line in enumerate(file_content.splitlines(), start=1)
+        )
 
         diffs_tasks = extract_diff_runnable.invoke({
             "task": current_atomic_task.atomic_task,
@@ -157,13 +160,18 @@ def creating_diffs_for_task(state: SoftwareDeveloperState):
             "research": convert_tools_messages_to_ai_and_human(state.atomic_implementation_research),
             "file_path": file_path,
             "file_content": file_content,
-            "output_format": JsonOutputParser(pydantic_object=Diffs).get_format_instructions()
+            "output_format": diffs_parser.get_format_instructions()
         })
         # Find all content between <code_change_request> and </code_change_request>
         blocks = re.findall(
             r"<code_change_request>(.*?)</code_change_request>", diffs_tasks, re.DOTALL
         )
 
+        # Apply all the diff blocks to an in-memory copy of the file and write it
+        # back once, instead of re-reading and re-writing the file per block
+        with open(file_path, "r") as f:
+            new_content = f.read().splitlines()
+        applied_any_block = False
         for block in blocks:
             # Use regex to extract the original code snippet and the task description.
             # The re.DOTALL flag allows the dot (.) to match newline characters.
@@ -173,22 +181,21 @@ def creating_diffs_for_task(state: SoftwareDeveloperState):
                 re.DOTALL,
             )
             if match:
-                with open(file_path, "r") as f:
-                    file_content = f.read()
                 original_code = match.group(1).strip()
                 edited_code = match.group(2).strip()
                 orig_lines = original_code.splitlines()
                 first_line = int(orig_lines[0].split("|")[0].strip())
                 last_line = int(orig_lines[-1].split("|")[0].strip())
-                new_content = file_content.splitlines()
                 new_content = (
                     new_content[: first_line - 1]
                     + edited_code.splitlines()
                     + new_content[last_line:]
                 )
-                with open(file_path, "w") as f:
-                    f.write("\n".join(new_content))
-                    f.flush()
+                applied_any_block = True
+        if applied_any_block:
+            with open(file_path, "w") as f:
+                f.write("\n".join(new_content))
+                f.flush()
 
 # Create tool node
 research_tool_node = ToolNode(search_tools + codemap_tools, messages_key="atomic_implementation_research")
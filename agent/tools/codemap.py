@@ -3,6 +3,45 @@ from typing import Optional
 from langchain_core.tools import tool
 from tree_sitter_languages import get_language, get_parser
 
+# File suffix -> tree-sitter language, shared by all codemap tools
+LANG_MAP = {
+    "py": "python",
+    "js": "javascript",
+    "jsx": "javascript",
+    "ts": "typescript",
+    "tsx": "typescript"
+}
+
+# Query for functions and classes with their signatures
+DEFINITIONS_QUERY = """
+(class_definition
+    name: (identifier) @name.definition.class
+    body: (block
+        (function_definition
+            name: (identifier) @name.definition.method
+            parameters: (parameters) @params.definition.method)?) @body.definition.class)
+
+(function_definition
+    name: (identifier) @name.definition.function
+    parameters: (parameters) @params.definition.function
+    body: (block) @body.definition.function)
+"""
+
+# Query for functions and methods with their full bodies
+IMPLEMENTATION_QUERY = """
+(function_definition
+    name: (identifier) @name.function
+    parameters: (parameters) @params.function
+    body: (block) @body.function)
+
+(class_definition
+    body: (block
+        (function_definition
+            name: (identifier) @name.method
+            parameters: (parameters) @params.method
+            body: (block) @body.method)))
+"""
+
 @tool(parse_docstring=True)
 def get_code_definitions(file_path: str) -> str:
     """
@@ -14,14 +53,7 @@ def get_code_definitions(file_path: str) -> str:
     """
     # Determine language
     suffix = file_path.split(".")[-1]
-    lang_map = {
-        "py": "python",
-        "js": "javascript",
-        "jsx": "javascript",
-        "ts": "typescript",
-        "tsx": "typescript"
-    }
-    lang = lang_map.get(suffix)
+    lang = LANG_MAP.get(suffix)
     if not lang:
         return f"Unsupported file type: {suffix}"
 
@@ -34,22 +66,7 @@ def get_code_definitions(file_path: str) -> str:
         code = f.read()
     tree = parser.parse(code)
 
-    # Define query for functions and classes
-    query_str = """
-    (class_definition
-        name: (identifier) @name.definition.class
-        body: (block 
-            (function_definition
-                name: (identifier) @name.definition.method
-                parameters: (parameters) @params.definition.method)?) @body.definition.class)
-
-    (function_definition
-        name: (identifier) @name.definition.function
-        parameters: (parameters) @params.definition.function
-        body: (block) @body.definition.function)
-    """
-
-    query = language.query(query_str)
+    query = language.query(DEFINITIONS_QUERY)
     captures = query.captures(tree.root_node)
 
     # Process captures to extract definitions
@@ -110,14 +127,7 @@ def get_function_implementation(file_path: str, function_name: str) -> Optional[
     """
     # Determine language
     suffix = file_path.split(".")[-1]
-    lang_map = {
-        "py": "python",
-        "js": "javascript",
-        "jsx": "javascript",
-        "ts": "typescript",
-        "tsx": "typescript"
-    }
-    lang = lang_map.get(suffix)
+    lang = LANG_MAP.get(suffix)
     if not lang:
         return None
 
@@ -130,22 +140,7 @@ def get_function_implementation(file_path: str, function_name: str) -> Optional[
         code = f.read()
     tree = parser.parse(code)
 
-    # Define query for functions and methods
-    query_str = """
-    (function_definition
-        name: (identifier) @name.function
-        parameters: (parameters) @params.function
-        body: (block) @body.function)
-
-    (class_definition
-        body: (block 
-            (function_definition
-                name: (identifier) @name.method
-                parameters: (parameters) @params.method
-                body: (block) @body.method)))
-    """
-
-    query = language.query(query_str)
+    query = language.query(IMPLEMENTATION_QUERY)
     captures = query.captures(tree.root_node)
 
     # Find the specific function
@@ -7,6 +7,8 @@ from langchain_core.tools import tool
 def search_in_file(file_path, search_term, context=2):
     """
     Search for search_term (case-insensitive) in a given file.
+    search_term can also be a precompiled regex pattern, which avoids
+    recompiling it when searching many files.
     Returns a list of tuples (line_number, snippet_lines, file_path) for each match,
     where snippet_lines is a list of (line_number, line) tuples that includes
     context lines before and after the matched line.
@@ -14,27 +16,39 @@ def search_in_file(file_path, search_term, context=2):
     results = []
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+            content = f.read()
     except Exception as e:
         print(f"Could not read {file_path}: {e}")
         return results
 
+    # compile a case-insensitive regex pattern for the search term,
+    # unless the caller already passed a precompiled pattern
+    if isinstance(search_term, re.Pattern):
+        pattern = search_term
+    else:
+        pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+
+    # cheap whole-file scan first: most files contain no match at all,
+    # so skip the per-line loop and snippet building entirely for them
+    if not pattern.search(content):
+        return results
+
     # Get absolute path
     abs_path = os.path.abspath(file_path)
 
-    # compile a case-insensitive regex pattern for the search term
-    pattern = re.compile(re.escape(search_term), re.IGNORECASE)
-
+    lines = content.splitlines()
     matches_found = False
+    # bind the bound method once, the loop below runs per line of the file
+    search = pattern.search
     for i, line in enumerate(lines):
-        if pattern.search(line):
+        if search(line):
             matches_found = True
             # Determine the snippet range: include 'context' lines before and after
             start = max(i - context, 0)
             end = min(i + context + 1, len(lines))
-            snippet = [(j+1, lines[j].rstrip('\n')) for j in range(start, end)]
+            snippet = [(j+1, lines[j]) for j in range(start, end)]
             results.append((i+1, snippet, abs_path))  # i+1 for the matching line number
-    
+
     return results
 
 def search_directory(directory, search_term, extension=None, context=2):
@@ -52,20 +66,23 @@ def search_directory(directory, search_term, extension=None, context=2):
         str: Formatted string containing all search results
     """
     output = []
+    # compile the pattern once for the whole walk instead of per file
+    pattern = re.compile(re.escape(search_term), re.IGNORECASE)
     for root, _, files in os.walk(directory):
         for file in files:
             if extension and not file.endswith(extension):
                 continue
-                
+
             file_path = os.path.join(root, file)
-            matches = search_in_file(file_path, search_term, context)
+            matches = search_in_file(file_path, pattern, context)
             if matches:
+                append = output.append
                 for match_line, snippet, abs_path in matches:  # Updated to unpack abs_path
-                    output.append(f"\nFile: {abs_path}")  # Using abs_path instead of file_path
-                    output.append(f"Match found at line: {match_line}")
+                    append(f"\nFile: {abs_path}")  # Using abs_path instead of file_path
+                    append(f"Match found at line: {match_line}")
                     for line_number, code in snippet:
-                        output.append(f"{line_number:4} | {code}")
-                    output.append("-" * 50)
+                        append(f"{line_number:4} | {code}")
+                    append("-" * 50)
     
     return "\n".join(output) if output else "No matches found."
 
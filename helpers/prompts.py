@@ -4,6 +4,10 @@ from typing import Union, List, Tuple
 
 from langchain_core.prompts import PromptTemplate, ChatPromptTemplate
 
+# Project root that relative prompt paths are resolved against. Computed once
+# at import instead of on every template load.
+_PROMPTS_ROOT = os.path.dirname(os.path.abspath(__file__)) + "/.."
+
 def _extract_input_variables(markdown_content: str) -> List[str]:
     # Use regex to find the section with input_variables
     input_variables_section = re.search(
@@ -51,18 +55,18 @@ def _validate_variables_in_content(
 
 
 def _validate_chat_message_format(markdown_content: str) -> None:
-    titles = re.findall(r"#+ [^#\n]*", markdown_content)
-    # filter out not main titles
-    titles = [title for title in titles if "##" not in title]
-    titles = [title.replace("#", "").strip() for title in titles]
+    # filter out not main titles and normalize them in a single pass
+    titles = [
+        title.replace("#", "").strip()
+        for title in re.findall(r"#+ [^#\n]*", markdown_content)
+        if "##" not in title
+    ]
 
     # Check if one of the titles is not system, human, ai, placeholder, function or tool messages
     if any(
-        [
-            title.lower()
-            not in ["system", "human", "ai", "placeholder", "function", "tool"]
-            for title in titles
-        ]
+        title.lower()
+        not in ["system", "human", "ai", "placeholder", "function", "tool"]
+        for title in titles
     ):
         raise ValueError(
             "Invalid markdown content for Chat template prompt. All titles should be either human, ai, placeholder, function or tool messages."
@@ -132,9 +136,7 @@ def load_markdown_as_chat_prompt_template(file_path: str) -> ChatPromptTemplate:
     return ChatPromptTemplate.from_messages(chat_template_pairs)
 
 def markdown_to_prompt_template(relative_prompt_path: str) -> Union[PromptTemplate, ChatPromptTemplate]:
-    absolute_prompt_path = (
-        f"{os.path.dirname(os.path.abspath(__file__))}/../{relative_prompt_path}"
-    )
+    absolute_prompt_path = f"{_PROMPTS_ROOT}/{relative_prompt_path}"
     with open(absolute_prompt_path, "r") as f:
         markdown_content = f.read()
 